@@ -25,6 +25,7 @@ def setup(
     signer=None,
     transport_timeout_s=DEFAULT_TRANSPORT_TIMEOUT_S,
     log_errors=True,
+    refresh_device_properties=False,
 ):
     """Connect to a device and determine whether it's an Android TV or an Amazon Fire TV.
 
@@ -52,6 +53,8 @@ def setup(
         Transport timeout (in seconds)
     log_errors: bool
         Whether connection errors should be logged
+    refresh_device_properties : bool
+        Whether to query the device properties even if they were previously retrieved for this host and port
 
     Returns
     -------
@@ -62,14 +65,14 @@ def setup(
     if device_class == "androidtv":
         atv = AndroidTVSync(host, port, adbkey, adb_server_ip, adb_server_port, state_detection_rules, signer)
         atv.adb_connect(log_errors=log_errors, auth_timeout_s=auth_timeout_s, transport_timeout_s=transport_timeout_s)
-        atv.get_device_properties()
+        atv.get_device_properties(refresh=refresh_device_properties)
         atv.get_installed_apps()
         return atv
 
     if device_class == "firetv":
         ftv = FireTVSync(host, port, adbkey, adb_server_ip, adb_server_port, state_detection_rules, signer)
         ftv.adb_connect(log_errors=log_errors, auth_timeout_s=auth_timeout_s, transport_timeout_s=transport_timeout_s)
-        ftv.get_device_properties()
+        ftv.get_device_properties(refresh=refresh_device_properties)
         ftv.get_installed_apps()
         return ftv
 
@@ -82,7 +85,7 @@ def setup(
     aftv.adb_connect(log_errors=log_errors, auth_timeout_s=auth_timeout_s, transport_timeout_s=transport_timeout_s)
 
     # get device properties
-    aftv.device_properties = aftv.get_device_properties()
+    aftv.device_properties = aftv.get_device_properties(refresh=refresh_device_properties)
 
     # get the installed apps
     aftv.get_installed_apps()
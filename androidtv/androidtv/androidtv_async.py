@@ -182,9 +182,8 @@ class AndroidTVAsync(BaseTVAsync, BaseAndroidTV):
         if lazy and not (screen_on and awake):
             return screen_on, awake, None, wake_lock_size, None, None, None, None, None, None, None
 
-        audio_state = await self.audio_state()
+        audio_state, audio_output_device, is_volume_muted, volume, _ = await self.audio_state_stream_music_properties()
         current_app, media_session_state = await self.current_app_media_session_state()
-        audio_output_device, is_volume_muted, volume, _ = await self.stream_music_properties()
 
         if get_running_apps:
             running_apps = await self.running_apps()
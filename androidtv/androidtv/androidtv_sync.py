@@ -184,9 +184,8 @@ class AndroidTVSync(BaseTVSync, BaseAndroidTV):
         if lazy and not (screen_on and awake):
             return screen_on, awake, None, wake_lock_size, None, None, None, None, None, None, None
 
-        audio_state = self.audio_state()
+        audio_state, audio_output_device, is_volume_muted, volume, _ = self.audio_state_stream_music_properties()
         current_app, media_session_state = self.current_app_media_session_state()
-        audio_output_device, is_volume_muted, volume, _ = self.stream_music_properties()
 
         if get_running_apps:
             running_apps = self.running_apps()
@@ -5,12 +5,48 @@ ADB Debugging must be enabled.
 
 
 import logging
-import re
 
 from .. import constants
 
 _LOGGER = logging.getLogger(__name__)
 
+#: The combined audio state and ``STREAM_MUSIC`` commands, keyed by the audio state command
+_CMD_AUDIO_STATE_STREAM_MUSIC = {
+    constants.CMD_AUDIO_STATE: constants.CMD_AUDIO_STATE_STREAM_MUSIC,
+    constants.CMD_AUDIO_STATE11: constants.CMD_AUDIO_STATE11_STREAM_MUSIC,
+}
+
+#: The maximum number of compiled volume regexes to keep in ``_VOLUME_REGEXES``
+_VOLUME_REGEXES_MAXSIZE = 8
+
+#: The compiled volume regexes, keyed by audio output device (see :func:`_volume_regex`)
+_VOLUME_REGEXES = {}
+
+
+def _volume_regex(audio_output_device):
+    """Get the compiled regular expression for the volume level of ``audio_output_device``.
+
+    Parameters
+    ----------
+    audio_output_device : str
+        The current audio playback device
+
+    Returns
+    -------
+    re.Pattern
+        The compiled regular expression for extracting the volume level of ``audio_output_device``
+
+    """
+    volume_regex = _VOLUME_REGEXES.get(audio_output_device)
+    if volume_regex is None:
+        if len(_VOLUME_REGEXES) >= _VOLUME_REGEXES_MAXSIZE:
+            _VOLUME_REGEXES.clear()
+
+        volume_regex = constants.compile_volume_regex(audio_output_device)
+        _VOLUME_REGEXES[audio_output_device] = volume_regex
+
+    return volume_regex
+
 
 class BaseTV(object):  # pylint: disable=too-few-public-methods
     """Base class for representing an Android TV / Fire TV device.
@@ -68,6 +104,12 @@ class BaseTV(object):  # pylint: disable=too-few-public-methods
 
     DEVICE_ENUM = constants.DeviceEnum.BASETV
 
+    #: The maximum number of devices whose properties are kept in ``_device_properties_cache``
+    _DEVICE_PROPERTIES_CACHE_MAXSIZE = 32
+
+    #: The device properties that have been retrieved, keyed by ``(host, port)``
+    _device_properties_cache = {}
+
     def __init__(
         self,
         adb,
@@ -148,6 +190,24 @@ class BaseTV(object):  # pylint: disable=too-few-public-methods
             return constants.CMD_AUDIO_STATE11
         return constants.CMD_AUDIO_STATE
 
+    def _cmd_audio_state_stream_music(self):
+        """Get the command used to retrieve the current audio state and the ``STREAM_MUSIC`` block for this device.
+
+        Returns
+        -------
+        str
+            The device-specific ADB shell command used to determine the current audio state and get the ``STREAM_MUSIC`` block
+
+        """
+        cmd_audio_state = self._cmd_audio_state()
+
+        # Use the precomposed command, unless a custom audio state command is being used
+        cmd_audio_state_stream_music = _CMD_AUDIO_STATE_STREAM_MUSIC.get(cmd_audio_state)
+        if cmd_audio_state_stream_music is None:
+            return cmd_audio_state + " ; echo && " + constants.CMD_STREAM_MUSIC
+
+        return cmd_audio_state_stream_music
+
     def _cmd_current_app(self):
         """Get the command used to retrieve the current app for this device.
 
@@ -421,27 +481,70 @@ class BaseTV(object):  # pylint: disable=too-few-public-methods
             return
 
         lines = properties.strip().splitlines()
-        if len(lines) != 4:
+        if len(lines) != len(constants.DEVICE_PROPERTIES_KEYS):
             self.device_properties = {}
             return
 
-        manufacturer, model, serialno, version = lines
+        # The lines correspond, in order, to the `getprop` commands in `constants.CMD_DEVICE_PROPERTIES`
+        self.device_properties = dict(zip(constants.DEVICE_PROPERTIES_KEYS, lines))
 
-        if not serialno.strip():
+        if not self.device_properties["serialno"].strip():
             _LOGGER.warning(
                 "Could not obtain serialno for %s:%d, got: '%s'",
                 self.host,
                 self.port,
-                serialno,
+                self.device_properties["serialno"],
             )
-            serialno = None
+            self.device_properties["serialno"] = None
+
+    def _parse_device_properties_mac(self, device_properties_mac_response):
+        """Return a dictionary of device properties, including the MAC addresses.
+
+        Parameters
+        ----------
+        device_properties_mac_response : str, None
+            The output of :py:const:`androidtv.constants.CMD_DEVICE_PROPERTIES_MAC`
+
+        This method fills in the ``device_properties`` attribute, which is a dictionary with keys
+        ``'serialno'``, ``'manufacturer'``, ``'model'``, ``'sw_version'``, ``'ethmac'``, and ``'wifimac'``
+
+        """
+        if device_properties_mac_response is None:
+            properties, ethmac_response, wifimac_response = None, None, None
+        else:
+            properties, _, mac_responses = device_properties_mac_response.partition(constants.MARKER_ETHMAC)
+            ethmac_response, _, wifimac_response = mac_responses.partition(constants.MARKER_WIFIMAC)
+
+        self._parse_device_properties(properties)
 
-        self.device_properties = {
-            "manufacturer": manufacturer,
-            "model": model,
-            "serialno": serialno,
-            "sw_version": version,
-        }
+        self.device_properties["ethmac"] = self._parse_mac_address(ethmac_response)
+        self.device_properties["wifimac"] = self._parse_mac_address(wifimac_response)
+
+    def _cache_device_properties(self):
+        """Cache the ``device_properties`` attribute for this host and port if it was successfully retrieved."""
+        if "serialno" not in self.device_properties:
+            return
+
+        if len(BaseTV._device_properties_cache) >= BaseTV._DEVICE_PROPERTIES_CACHE_MAXSIZE:
+            BaseTV._device_properties_cache.clear()
+
+        BaseTV._device_properties_cache[(self.host, self.port)] = dict(self.device_properties)
+
+    def _load_cached_device_properties(self):
+        """Load the device properties that were previously retrieved for this host and port.
+
+        Returns
+        -------
+        bool
+            Whether or not cached device properties were found and loaded into the ``device_properties`` attribute
+
+        """
+        cached_device_properties = BaseTV._device_properties_cache.get((self.host, self.port))
+        if cached_device_properties is None:
+            return False
+
+        self.device_properties = dict(cached_device_properties)
+        return True
 
     @staticmethod
     def _parse_mac_address(mac_response):
@@ -461,9 +564,9 @@ class BaseTV(object):  # pylint: disable=too-few-public-methods
         if not mac_response:
             return None
 
-        mac_matches = re.findall(constants.MAC_REGEX_PATTERN, mac_response)
+        mac_matches = constants.REGEX_MAC.search(mac_response)
         if mac_matches:
-            return mac_matches[0]
+            return mac_matches.group(1)
 
         return None
 
@@ -594,9 +697,9 @@ class BaseTV(object):  # pylint: disable=too-few-public-methods
         if not stream_music:
             return None
 
-        matches = re.findall(constants.DEVICE_REGEX_PATTERN, stream_music, re.DOTALL | re.MULTILINE)
+        matches = constants.REGEX_DEVICE.search(stream_music)
         if matches:
-            return matches[0]
+            return matches.group(1)
 
         return None
 
@@ -623,6 +726,30 @@ class BaseTV(object):  # pylint: disable=too-few-public-methods
             return constants.STATE_PLAYING
         return constants.STATE_IDLE
 
+    def _audio_state_stream_music(self, audio_state_stream_music_response):
+        """Parse the output of the command `androidtv.basetv.basetv.BaseTV._cmd_audio_state_stream_music`.
+
+        Parameters
+        ----------
+        audio_state_stream_music_response : str, None
+            The output of the command `androidtv.basetv.basetv.BaseTV._cmd_audio_state_stream_music`
+
+        Returns
+        -------
+        audio_state : str, None
+            The audio state, or ``None`` if it could not be determined
+        stream_music : str, None
+            The ``STREAM_MUSIC`` block from ``adb shell dumpsys audio``, or ``None`` if it could not be determined
+
+        """
+        if not audio_state_stream_music_response:
+            return None, None
+
+        audio_state_response, _, stream_music_raw = audio_state_stream_music_response.partition("\n")
+
+        # Strip the audio state in case the shell uses "\r\n" line endings
+        return self._audio_state(audio_state_response.strip()), self._parse_stream_music(stream_music_raw)
+
     @staticmethod
     def _current_app(current_app_response):
         """Get the current app from the output of the command `androidtv.basetv.basetv.BaseTV._cmd_current_app`.
@@ -662,7 +789,8 @@ class BaseTV(object):  # pylint: disable=too-few-public-methods
         if not current_app_media_session_state_response:
             return None, None
 
-        lines = current_app_media_session_state_response.splitlines()
+        # Only the first line is needed on its own, so don't split the entire response into lines
+        lines = current_app_media_session_state_response.split("\n", 1)
 
         current_app = self._current_app(lines[0].strip())
 
@@ -730,9 +858,9 @@ class BaseTV(object):  # pylint: disable=too-few-public-methods
         if not stream_music:
             return None
 
-        matches = re.findall(constants.MUTED_REGEX_PATTERN, stream_music, re.DOTALL | re.MULTILINE)
+        matches = constants.REGEX_MUTED.search(stream_music)
         if matches:
-            return matches[0] == "true"
+            return matches.group(1) == "true"
 
         return None
 
@@ -754,15 +882,17 @@ class BaseTV(object):  # pylint: disable=too-few-public-methods
         if not stream_music_raw:
             return None
 
-        matches = re.findall(
-            constants.STREAM_MUSIC_REGEX_PATTERN,
-            stream_music_raw,
-            re.DOTALL | re.MULTILINE,
-        )
-        if matches:
-            return matches[0]
+        # Equivalent to `constants.STREAM_MUSIC_REGEX_PATTERN`, but without invoking the regex engine
+        start = stream_music_raw.find("STREAM_MUSIC")
+        if start == -1:
+            return None
 
-        return None
+        start += len("STREAM_MUSIC")
+        end = stream_music_raw.find("- STREAM", start)
+        if end == -1:
+            return None
+
+        return stream_music_raw[start:end]
 
     @staticmethod
     def _running_apps(running_apps_response):
@@ -811,7 +941,7 @@ class BaseTV(object):  # pylint: disable=too-few-public-methods
 
         screen_on = output[0] == "1"
         awake = None if len(output) < 2 else output[1] == "1"
-        wake_lock_size = None if len(output) < 3 else BaseTV._wake_lock_size(output[2:])
+        wake_lock_size = BaseTV._wake_lock_size(output, 2)
 
         return screen_on, awake, wake_lock_size
 
@@ -835,24 +965,16 @@ class BaseTV(object):  # pylint: disable=too-few-public-methods
             return None
 
         if not self.max_volume:
-            max_volume_matches = re.findall(
-                constants.MAX_VOLUME_REGEX_PATTERN,
-                stream_music,
-                re.DOTALL | re.MULTILINE,
-            )
+            max_volume_matches = constants.REGEX_MAX_VOLUME.search(stream_music)
             if max_volume_matches:
-                self.max_volume = float(max_volume_matches[0])
+                self.max_volume = float(max_volume_matches.group(1))
 
         if not audio_output_device:
             return None
 
-        volume_matches = re.findall(
-            audio_output_device + constants.VOLUME_REGEX_PATTERN,
-            stream_music,
-            re.DOTALL | re.MULTILINE,
-        )
+        volume_matches = _volume_regex(audio_output_device).search(stream_music)
         if volume_matches:
-            return int(volume_matches[0])
+            return int(volume_matches.group(1))
 
         return None
 
@@ -875,14 +997,47 @@ class BaseTV(object):  # pylint: disable=too-few-public-methods
 
         return None
 
+    def _stream_music_properties(self, stream_music):
+        """Get various properties from the ``STREAM_MUSIC`` block from ``adb shell dumpsys audio``.
+
+        Parameters
+        ----------
+        stream_music : str, None
+            The ``STREAM_MUSIC`` block from ``adb shell dumpsys audio``
+
+        Returns
+        -------
+        audio_output_device : str, None
+            The current audio playback device, or ``None`` if it could not be determined
+        is_volume_muted : bool, None
+            Whether or not the volume is muted, or ``None`` if it could not be determined
+        volume : int, None
+            The absolute volume level, or ``None`` if it could not be determined
+        volume_level : float, None
+            The volume level (between 0 and 1), or ``None`` if it could not be determined
+
+        """
+        # `_parse_stream_music` returns `None` if the "STREAM_MUSIC" literal is absent, in which case none of the regexes can match
+        if not stream_music:
+            return None, None, None, None
+
+        audio_output_device = self._audio_output_device(stream_music)
+        volume = self._volume(stream_music, audio_output_device)
+        volume_level = self._volume_level(volume)
+        is_volume_muted = self._is_volume_muted(stream_music)
+
+        return audio_output_device, is_volume_muted, volume, volume_level
+
     @staticmethod
-    def _wake_lock_size(wake_lock_size_response):
+    def _wake_lock_size(wake_lock_size_response, start=0):
         """Get the size of the current wake lock from the output of :py:const:`androidtv.constants.CMD_WAKE_LOCK_SIZE`.
 
         Parameters
         ----------
         wake_lock_size_response : str, None
             The output of :py:const:`androidtv.constants.CMD_WAKE_LOCK_SIZE`
+        start : int
+            The index in ``wake_lock_size_response`` at which the wake lock size output begins
 
         Returns
         -------
@@ -890,10 +1045,16 @@ class BaseTV(object):  # pylint: disable=too-few-public-methods
             The size of the current wake lock, or ``None`` if it could not be determined
 
         """
-        if wake_lock_size_response:
-            wake_lock_size_matches = constants.REGEX_WAKE_LOCK_SIZE.search(wake_lock_size_response)
-            if wake_lock_size_matches:
-                return int(wake_lock_size_matches.group("size"))
+        if not wake_lock_size_response:
+            return None
+
+        size_start = wake_lock_size_response.find("size=", start)
+        if size_start == -1:
+            return None
+
+        wake_lock_size_matches = constants.REGEX_WAKE_LOCK_SIZE.match(wake_lock_size_response, size_start)
+        if wake_lock_size_matches:
+            return int(wake_lock_size_matches.group("size"))
 
         return None
 
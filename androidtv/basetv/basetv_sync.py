@@ -198,23 +198,27 @@ class BaseTVSync(BaseTV):
     #                        Home Assistant device info                       #
     #                                                                         #
     # ======================================================================= #
-    def get_device_properties(self):
+    def get_device_properties(self, refresh=True):
         """Return a dictionary of device properties.
 
+        Parameters
+        ----------
+        refresh : bool
+            If ``False``, use the properties that were previously retrieved for this host and port, if any, instead of querying the device
+
         Returns
         -------
         props : dict
             A dictionary with keys ``'wifimac'``, ``'ethmac'``, ``'serialno'``, ``'manufacturer'``, ``'model'``, and ``'sw_version'``
 
         """
-        properties = self._adb.shell(constants.CMD_DEVICE_PROPERTIES)
+        if not refresh and self._load_cached_device_properties():
+            return self.device_properties
 
-        self._parse_device_properties(properties)
+        device_properties_mac_response = self._adb.shell(constants.CMD_DEVICE_PROPERTIES_MAC)
 
-        ethmac_response = self._adb.shell(constants.CMD_MAC_ETH0)
-        wifimac_response = self._adb.shell(constants.CMD_MAC_WLAN0)
-        self.device_properties["ethmac"] = self._parse_mac_address(ethmac_response)
-        self.device_properties["wifimac"] = self._parse_mac_address(wifimac_response)
+        self._parse_device_properties_mac(device_properties_mac_response)
+        self._cache_device_properties()
 
         return self.device_properties
 
@@ -248,6 +252,28 @@ class BaseTVSync(BaseTV):
         audio_state_response = self._adb.shell(self._cmd_audio_state())
         return self._audio_state(audio_state_response)
 
+    def audio_state_stream_music_properties(self):
+        """Get the audio state and various properties from the "STREAM_MUSIC" block from ``dumpsys audio``.
+
+        Returns
+        -------
+        audio_state : str, None
+            The audio state, or ``None`` if it could not be determined
+        audio_output_device : str, None
+            The current audio playback device, or ``None`` if it could not be determined
+        is_volume_muted : bool, None
+            Whether or not the volume is muted, or ``None`` if it could not be determined
+        volume : int, None
+            The absolute volume level, or ``None`` if it could not be determined
+        volume_level : float, None
+            The volume level (between 0 and 1), or ``None`` if it could not be determined
+
+        """
+        audio_state_stream_music_response = self._adb.shell(self._cmd_audio_state_stream_music())
+        audio_state, stream_music = self._audio_state_stream_music(audio_state_stream_music_response)
+
+        return (audio_state,) + self._stream_music_properties(stream_music)
+
     def awake(self):
         """Check if the device is awake (screensaver is not running).
 
@@ -402,12 +428,8 @@ class BaseTVSync(BaseTV):
 
         """
         stream_music = self._get_stream_music()
-        audio_output_device = self._audio_output_device(stream_music)
-        volume = self._volume(stream_music, audio_output_device)
-        volume_level = self._volume_level(volume)
-        is_volume_muted = self._is_volume_muted(stream_music)
 
-        return audio_output_device, is_volume_muted, volume, volume_level
+        return self._stream_music_properties(stream_music)
 
     def volume(self):
         """Get the absolute volume level.
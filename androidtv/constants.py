@@ -11,6 +11,14 @@
 import re
 import sys
 
+try:
+    import re2
+except ImportError:  # pragma: no cover
+    re2 = None
+
+# Only use ``re2`` if it is the ``google-re2`` package (which provides ``re2.Options``), not another module named ``re2``
+_regex = re2 if hasattr(re2, "Options") else re
+
 if sys.version_info[0] == 3 and sys.version_info[1] >= 5:
     from enum import IntEnum, unique
 else:  # pragma: no cover
@@ -73,7 +81,10 @@ CMD_SUCCESS1 = r" && echo -e '1\c'"
 CMD_SUCCESS1_FAILURE0 = r" && echo -e '1\c' || echo -e '0\c'"
 
 #: Get the audio state
-CMD_AUDIO_STATE = r"dumpsys audio | grep paused | grep -qv 'Buffer Queue' && echo -e '1\c' || (dumpsys audio | grep started | grep -qv 'Buffer Queue' && echo '2\c' || echo '0\c')"
+CMD_AUDIO_STATE = (
+    "CURRENT_AUDIO_STATE=$(dumpsys audio | grep -v 'Buffer Queue' | grep -E -o 'paused|started') ; "
+    + r"echo $CURRENT_AUDIO_STATE | grep -q paused && echo -e '1\c' || { echo $CURRENT_AUDIO_STATE | grep -q started && echo '2\c' || echo '0\c' ; }"
+)
 
 #: Get the audio state for an Android 11 device
 CMD_AUDIO_STATE11 = (
@@ -220,6 +231,12 @@ CMD_SCREEN_ON = "(dumpsys power | grep 'Display Power' | grep -q 'state=ON' || d
 #: Get the "STREAM_MUSIC" block from ``dumpsys audio``
 CMD_STREAM_MUSIC = r"dumpsys audio | grep '\- STREAM_MUSIC:' -A 11"
 
+#: Get the audio state and the "STREAM_MUSIC" block from ``dumpsys audio``
+CMD_AUDIO_STATE_STREAM_MUSIC = CMD_AUDIO_STATE + " ; echo && " + CMD_STREAM_MUSIC
+
+#: Get the audio state and the "STREAM_MUSIC" block from ``dumpsys audio`` for an Android 11 device
+CMD_AUDIO_STATE11_STREAM_MUSIC = CMD_AUDIO_STATE11 + " ; echo && " + CMD_STREAM_MUSIC
+
 #: Turn off an Android TV device (note: `KEY_POWER = 26` is defined below)
 CMD_TURN_OFF_ANDROIDTV = CMD_SCREEN_ON + " && input keyevent 26"
 
@@ -253,6 +270,26 @@ CMD_MAC_ETH0 = "ip addr show eth0 | grep -m 1 ether"
 #: The command used for getting the device properties
 CMD_DEVICE_PROPERTIES = CMD_MANUFACTURER + " && " + CMD_MODEL + " && " + CMD_SERIALNO + " && " + CMD_VERSION
 
+#: The ``device_properties`` keys for the lines of output from :py:const:`CMD_DEVICE_PROPERTIES`, in order
+DEVICE_PROPERTIES_KEYS = ("manufacturer", "model", "serialno", "sw_version")
+
+#: The markers that precede the outputs of :py:const:`CMD_MAC_ETH0` and :py:const:`CMD_MAC_WLAN0` in the output of :py:const:`CMD_DEVICE_PROPERTIES_MAC`
+MARKER_ETHMAC = "ETHMAC"
+MARKER_WIFIMAC = "WIFIMAC"
+
+#: The command used for getting the device properties and the MAC addresses in a single ADB shell call
+CMD_DEVICE_PROPERTIES_MAC = (
+    CMD_DEVICE_PROPERTIES
+    + " ; echo "
+    + MARKER_ETHMAC
+    + " ; "
+    + CMD_MAC_ETH0
+    + " ; echo "
+    + MARKER_WIFIMAC
+    + " ; "
+    + CMD_MAC_WLAN0
+)
+
 
 # ADB key event codes
 # https://developer.android.com/reference/android/view/KeyEvent
@@ -651,10 +688,6 @@ APPS = {
 }
 
 
-# Regular expressions
-REGEX_MEDIA_SESSION_STATE = re.compile(r"state=(?P<state>[0-9]+)", re.MULTILINE)
-REGEX_WAKE_LOCK_SIZE = re.compile(r"size=(?P<size>[0-9]+)")
-
 # Regular expression patterns
 DEVICE_REGEX_PATTERN = r"Devices: (.*?)\W"
 MAC_REGEX_PATTERN = "ether (.*?) brd"
@@ -663,6 +696,32 @@ MUTED_REGEX_PATTERN = r"Muted: (.*?)\W"
 STREAM_MUSIC_REGEX_PATTERN = "STREAM_MUSIC(.*?)- STREAM"
 VOLUME_REGEX_PATTERN = r"\): (\d{1,})"
 
+# Regular expressions (compiled with RE2 if the optional ``google-re2`` package is installed)
+REGEX_DEVICE = _regex.compile(DEVICE_REGEX_PATTERN)
+REGEX_MAC = _regex.compile(MAC_REGEX_PATTERN)
+REGEX_MAX_VOLUME = _regex.compile(MAX_VOLUME_REGEX_PATTERN)
+REGEX_MEDIA_SESSION_STATE = _regex.compile(r"state=(?P<state>[0-9]+)")
+REGEX_MUTED = _regex.compile(MUTED_REGEX_PATTERN)
+REGEX_WAKE_LOCK_SIZE = _regex.compile(r"size=(?P<size>[0-9]+)")
+
+
+def compile_volume_regex(audio_output_device):
+    """Compile the regular expression for the volume level of ``audio_output_device``.
+
+    Parameters
+    ----------
+    audio_output_device : str
+        The current audio playback device
+
+    Returns
+    -------
+    re.Pattern
+        The compiled regular expression for extracting the volume level of ``audio_output_device``
+
+    """
+    return _regex.compile(_regex.escape(audio_output_device) + VOLUME_REGEX_PATTERN)
+
+
 #: Default authentication timeout (in s) for :meth:`adb_shell.handle.tcp_handle.TcpHandle.connect` and :meth:`adb_shell.handle.tcp_handle_async.TcpHandleAsync.connect`
 DEFAULT_AUTH_TIMEOUT_S = 10.0
 
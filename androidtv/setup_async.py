@@ -21,6 +21,7 @@ async def setup(
     signer=None,
     transport_timeout_s=DEFAULT_TRANSPORT_TIMEOUT_S,
     log_errors=True,
+    refresh_device_properties=False,
 ):
     """Connect to a device and determine whether it's an Android TV or an Amazon Fire TV.
 
@@ -48,6 +49,8 @@ async def setup(
         Transport timeout (in seconds)
     log_errors: bool
         Whether connection errors should be logged
+    refresh_device_properties : bool
+        Whether to query the device properties even if they were previously retrieved for this host and port
 
     Returns
     -------
@@ -60,7 +63,7 @@ async def setup(
         await atv.adb_connect(
             log_errors=log_errors, auth_timeout_s=auth_timeout_s, transport_timeout_s=transport_timeout_s
         )
-        await atv.get_device_properties()
+        await atv.get_device_properties(refresh=refresh_device_properties)
         await atv.get_installed_apps()
         return atv
 
@@ -69,7 +72,7 @@ async def setup(
         await ftv.adb_connect(
             log_errors=log_errors, auth_timeout_s=auth_timeout_s, transport_timeout_s=transport_timeout_s
         )
-        await ftv.get_device_properties()
+        await ftv.get_device_properties(refresh=refresh_device_properties)
         await ftv.get_installed_apps()
         return ftv
 
@@ -84,7 +87,7 @@ async def setup(
     )
 
     # get device properties
-    await aftv.get_device_properties()
+    await aftv.get_device_properties(refresh=refresh_device_properties)
 
     # get the installed apps
     await aftv.get_installed_apps()
@@ -104,7 +104,7 @@ class TestAndroidTVAsyncPython(unittest.TestCase):
     @awaiter
     async def test_stream_music_properties(self):
         """Check that the ``stream_music_properties`` method works correctly."""
-        with async_patchers.patch_shell(None)[self.PATCH_KEY]:
+        with async_patchers.patch_shell(STREAM_MUSIC_ON)[self.PATCH_KEY]:
             with patch_calls(self.atv, self.atv._audio_output_device) as audio_output_device, patch_calls(
                 self.atv, self.atv._is_volume_muted
             ) as is_volume_muted, patch_calls(self.atv, self.atv._volume) as volume, patch_calls(
@@ -116,6 +116,11 @@ class TestAndroidTVAsyncPython(unittest.TestCase):
                 assert volume.called
                 assert volume_level.called
 
+        with async_patchers.patch_shell(None)[self.PATCH_KEY]:
+            with patch_calls(self.atv, self.atv._stream_music_properties) as stream_music_properties:
+                self.assertTupleEqual(await self.atv.stream_music_properties(), (None, None, None, None))
+                assert stream_music_properties.called
+
             with patch_calls(self.atv, self.atv._audio_output_device) as audio_output_device:
                 await self.atv.audio_output_device()
                 assert audio_output_device.called
@@ -132,6 +137,23 @@ class TestAndroidTVAsyncPython(unittest.TestCase):
                 await self.atv.volume_level()
                 assert volume_level.called
 
+    @awaiter
+    async def test_audio_state_stream_music_properties(self):
+        """Check that the ``audio_state_stream_music_properties`` method works correctly."""
+        with async_patchers.patch_shell(None)[self.PATCH_KEY]:
+            with patch_calls(self.atv, self.atv._audio_state_stream_music) as audio_state_stream_music, patch_calls(
+                self.atv, self.atv._stream_music_properties
+            ) as stream_music_properties:
+                await self.atv.audio_state_stream_music_properties()
+                assert audio_state_stream_music.called
+                assert stream_music_properties.called
+
+        with async_patchers.patch_shell("2\n" + STREAM_MUSIC_ON)[self.PATCH_KEY]:
+            self.assertTupleEqual(
+                await self.atv.audio_state_stream_music_properties(),
+                (constants.STATE_PLAYING, "hmdi_arc", False, 22, 22 / 60.0),
+            )
+
     @awaiter
     async def test_set_volume_level(self):
         """Check that the ``set_volume_level`` method works correctly."""
@@ -199,6 +199,48 @@ class TestAndroidTVSyncPython(unittest.TestCase):
             self.assertEqual(self.atv.volume(), 22)
             self.assertEqual(self.atv.max_volume, 60.0)
 
+    def test_audio_state_stream_music_properties(self):
+        """Check that the ``audio_state_stream_music_properties`` method works correctly."""
+        with patchers.patch_shell(None)[self.PATCH_KEY]:
+            self.assertTupleEqual(self.atv.audio_state_stream_music_properties(), (None, None, None, None, None))
+
+        with patchers.patch_shell("")[self.PATCH_KEY]:
+            self.assertTupleEqual(self.atv.audio_state_stream_music_properties(), (None, None, None, None, None))
+
+        with patchers.patch_shell("0\n")[self.PATCH_KEY]:
+            self.assertTupleEqual(
+                self.atv.audio_state_stream_music_properties(), (constants.STATE_IDLE, None, None, None, None)
+            )
+
+        with patchers.patch_shell("1\n" + STREAM_MUSIC_OFF)[self.PATCH_KEY]:
+            self.assertTupleEqual(
+                self.atv.audio_state_stream_music_properties(),
+                (constants.STATE_PAUSED, "speaker", False, 20, 20 / 60.0),
+            )
+            self.assertEqual(
+                getattr(self.atv._adb, self.ADB_ATTR).shell_cmd,
+                constants.CMD_AUDIO_STATE_STREAM_MUSIC,
+            )
+
+        with patchers.patch_shell("2\n" + STREAM_MUSIC_ON)[self.PATCH_KEY]:
+            self.assertTupleEqual(
+                self.atv.audio_state_stream_music_properties(),
+                (constants.STATE_PLAYING, "hmdi_arc", False, 22, 22 / 60.0),
+            )
+
+        # "\r\n" line endings
+        with patchers.patch_shell("2\r\n" + STREAM_MUSIC_ON.replace("\n", "\r\n"))[self.PATCH_KEY]:
+            self.assertTupleEqual(
+                self.atv.audio_state_stream_music_properties(),
+                (constants.STATE_PLAYING, "hmdi_arc", False, 22, 22 / 60.0),
+            )
+
+        with patchers.patch_shell("0\n" + STREAM_MUSIC_ON)[self.PATCH_KEY]:
+            self.assertTupleEqual(
+                self.atv.audio_state_stream_music_properties(),
+                (constants.STATE_IDLE, "hmdi_arc", False, 22, 22 / 60.0),
+            )
+
     def test_set_volume_level(self):
         """Check that the ``set_volume_level`` method works correctly."""
         with patchers.patch_shell(None)[self.PATCH_KEY]:
@@ -638,6 +680,10 @@ class TestAndroidTVSyncPython(unittest.TestCase):
             self.atv.audio_state()
             patched.assert_called_with("6")
 
+        with patch.object(self.atv._adb, "shell", return_value="") as patched:
+            self.atv.audio_state_stream_music_properties()
+            patched.assert_called_with("6 ; echo && " + constants.CMD_STREAM_MUSIC)
+
         self.atv.customize_command(constants.CUSTOM_HDMI_INPUT, "7")
         with patch.object(self.atv._adb, "shell") as patched:
             self.atv.get_hdmi_input()
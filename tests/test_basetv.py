@@ -1,11 +1,23 @@
+import re
 import sys
 import unittest
 
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 
 sys.path.insert(0, "..")
 
 from androidtv import constants
 from androidtv.androidtv.base_androidtv import BaseAndroidTV
+from androidtv.basetv.basetv import BaseTV, _VOLUME_REGEXES, _VOLUME_REGEXES_MAXSIZE, _volume_regex
 from androidtv.firetv.base_firetv import BaseFireTV
 
 
@@ -17,3 +29,111 @@ class TestBaseTV(unittest.TestCase):
     def test_base_fire_tv(self):
         """Test that ``BaseFireTV.__init__`` runs without error."""
         BaseFireTV("host")
+
+    def test_parse_stream_music(self):
+        """Test that ``BaseTV._parse_stream_music`` matches ``constants.STREAM_MUSIC_REGEX_PATTERN``."""
+        for stream_music_raw in [
+            "- STREAM_MUSIC:\n   Muted: false\n   Devices: speaker\n- STREAM_ALARM:\n   Muted: true\n",
+            "- STREAM_MUSIC:\n   Muted: false\n   Devices: speaker\n",
+            "- STREAM_ALARM:\n   Muted: true\n- STREAM_MUSIC:\n   Muted: false\n- STREAM",
+            "- STREAM_MUSIC:- STREAM",
+            "Muted: false",
+        ]:
+            matches = re.findall(constants.STREAM_MUSIC_REGEX_PATTERN, stream_music_raw, re.DOTALL | re.MULTILINE)
+            expected = matches[0] if matches else None
+            self.assertEqual(BaseTV._parse_stream_music(stream_music_raw), expected)
+
+    def test_volume_regex(self):
+        """Test that ``_volume_regex`` treats the audio output device literally and caches the compiled regex."""
+        with patch.dict(_VOLUME_REGEXES, clear=True):
+            self.assertIs(_volume_regex("speaker"), _volume_regex("speaker"))
+
+            # The cache is cleared once it is full
+            self.assertIn("speaker", _VOLUME_REGEXES)
+            for i in range(_VOLUME_REGEXES_MAXSIZE):
+                _volume_regex("device{}".format(i))
+            self.assertLessEqual(len(_VOLUME_REGEXES), _VOLUME_REGEXES_MAXSIZE)
+            self.assertNotIn("speaker", _VOLUME_REGEXES)
+
+            stream_music = "   Current: 2 (axb): 5, 40000 (a.b): 7\n   Devices: a.b\n"
+            btv = BaseAndroidTV("host")
+            self.assertEqual(btv._volume(stream_music, "a.b"), 7)
+            self.assertEqual(btv._volume(stream_music, "axb"), 5)
+
+    def test_regexes_without_flags(self):
+        """Test that the compiled regexes, which are not compiled with any flags, match the ``re.DOTALL | re.MULTILINE`` patterns."""
+        stream_music = """:
+   Muted: false
+   Min: 0
+   Max: 60
+   Current: 2 (speaker): 20, 40000 (hmdi_arc): 22, 40000000 (default): 15
+   Devices: hmdi_arc
+"""
+        for regex, pattern in [
+            (constants.REGEX_DEVICE, constants.DEVICE_REGEX_PATTERN),
+            (constants.REGEX_MAX_VOLUME, constants.MAX_VOLUME_REGEX_PATTERN),
+            (constants.REGEX_MUTED, constants.MUTED_REGEX_PATTERN),
+            (_volume_regex("hmdi_arc"), "hmdi_arc" + constants.VOLUME_REGEX_PATTERN),
+        ]:
+            self.assertEqual(
+                regex.search(stream_music).group(1),
+                re.search(pattern, stream_music, re.DOTALL | re.MULTILINE).group(1),
+            )
+
+        media_session_state = "com.netflix.ninja\n      state=PlaybackState {state=3, position=0}"
+        self.assertEqual(
+            constants.REGEX_MEDIA_SESSION_STATE.search(media_session_state).group("state"),
+            re.search(r"state=(?P<state>[0-9]+)", media_session_state, re.MULTILINE).group("state"),
+        )
+
+    def test_wake_lock_size(self):
+        """Test that ``BaseTV._wake_lock_size`` matches ``constants.REGEX_WAKE_LOCK_SIZE``."""
+        for wake_lock_size_response in [
+            "Wake Locks: size=2",
+            "Wake Locks: size=13\r\n",
+            "Wake Locks: size=0\nSuspend Blockers: size=4",
+            "Failed to write while dumping serviceWake Locks: size=2",
+            "Wake Locks: size=",
+            "Wake Locks: size=3 x",
+            "Wake Locks: size=\u00b2",
+            "Wake Locks",
+            "",
+            None,
+        ]:
+            matches = constants.REGEX_WAKE_LOCK_SIZE.search(wake_lock_size_response or "")
+            expected = int(matches.group("size")) if matches else None
+            self.assertEqual(BaseTV._wake_lock_size(wake_lock_size_response), expected)
+
+        self.assertEqual(BaseTV._wake_lock_size("10size=3", 2), 3)
+        self.assertIsNone(BaseTV._wake_lock_size("1size=3", 2))
+
+    @unittest.skipIf(not hasattr(re2, "Options"), "The google-re2 package is not installed")
+    def test_regexes_re2(self):
+        """Test that the regexes are compiled with RE2 when it is installed and that they match the ``re`` results."""
+        self.assertIs(constants._regex, re2)
+
+        stream_music = """:
+   Muted: false
+   Min: 0
+   Max: 60
+   Current: 2 (speaker): 20, 40000 (hmdi_arc): 22, 40000000 (default): 15
+   Devices: hmdi_arc
+"""
+        for regex, pattern, string in [
+            (constants.REGEX_DEVICE, constants.DEVICE_REGEX_PATTERN, stream_music),
+            (
+                constants.REGEX_MAC,
+                constants.MAC_REGEX_PATTERN,
+                "    link/ether ab:cd:ef:gh:ij:kl brd ff:ff:ff:ff:ff:ff",
+            ),
+            (constants.REGEX_MAX_VOLUME, constants.MAX_VOLUME_REGEX_PATTERN, stream_music),
+            (constants.REGEX_MEDIA_SESSION_STATE, r"state=(?P<state>[0-9]+)", "state=PlaybackState {state=3"),
+            (constants.REGEX_MUTED, constants.MUTED_REGEX_PATTERN, stream_music),
+            (constants.REGEX_WAKE_LOCK_SIZE, r"size=(?P<size>[0-9]+)", "Wake Locks: size=2"),
+            (_volume_regex("hmdi_arc"), re.escape("hmdi_arc") + constants.VOLUME_REGEX_PATTERN, stream_music),
+        ]:
+            self.assertEqual(regex.search(string).group(1), re.search(pattern, string).group(1))
+
+        btv = BaseAndroidTV("host")
+        btv.max_volume = 60.0
+        self.assertTupleEqual(btv._stream_music_properties(stream_music[1:]), ("hmdi_arc", False, 22, 22 / 60.0))
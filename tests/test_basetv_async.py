@@ -343,10 +343,16 @@ class TestBaseTVAsyncPython(unittest.TestCase):
     async def test_get_device_properties(self):
         """Check that ``get_device_properties`` works correctly."""
         with async_patchers.patch_shell("")[self.PATCH_KEY]:
-            with patch_calls(self.btv, self.btv._parse_device_properties) as patched:
+            with patch_calls(self.btv, self.btv._parse_device_properties_mac) as patched:
                 await self.btv.get_device_properties()
                 assert patched.called
 
+        with patch.dict(BaseTVAsync._device_properties_cache, {("HOST", 5555): {"serialno": "1234"}}, clear=True):
+            with async_patchers.patch_shell("")[self.PATCH_KEY]:
+                with patch_calls(self.btv, self.btv._parse_device_properties_mac) as patched:
+                    self.assertDictEqual(await self.btv.get_device_properties(refresh=False), {"serialno": "1234"})
+                    assert not patched.called
+
     @awaiter
     async def test_awake(self):
         """Check that the ``awake`` property works correctly."""
@@ -11,10 +11,18 @@ sys.path.insert(0, "..")
 
 from androidtv import constants, ha_state_detection_rules_validator
 from androidtv.androidtv.androidtv_sync import AndroidTVSync
+from androidtv.basetv.basetv import BaseTV
 from androidtv.basetv.basetv_sync import BaseTVSync
 from . import patchers
 
 
+def device_properties_mac_output(properties, ethmac, wifimac):
+    """Combine the outputs into the output of :py:const:`androidtv.constants.CMD_DEVICE_PROPERTIES_MAC`."""
+    return "{}\n{}\n{}\n{}\n{}".format(
+        properties, constants.MARKER_ETHMAC, ethmac or "", constants.MARKER_WIFIMAC, wifimac or ""
+    )
+
+
 DEVICE_PROPERTIES_OUTPUT1 = """Amazon
 AFTT
 SERIALNO
@@ -183,12 +191,18 @@ class TestBaseTVSyncPython(unittest.TestCase):
     ADB_ATTR = "_adb"
 
     def setUp(self):
+        self.patch_device_properties_cache = patch.dict(BaseTV._device_properties_cache, clear=True)
+        self.patch_device_properties_cache.start()
+
         with patchers.PATCH_ADB_DEVICE_TCP, patchers.patch_connect(True)[self.PATCH_KEY], patchers.patch_shell("")[
             self.PATCH_KEY
         ]:
             self.btv = BaseTVSync("HOST", 5555)
             self.btv.adb_connect()
 
+    def tearDown(self):
+        self.patch_device_properties_cache.stop()
+
     def test_available(self):
         """Test that the available property works correctly."""
         self.assertTrue(self.btv.available)
@@ -553,7 +567,7 @@ class TestBaseTVSyncPython(unittest.TestCase):
         with patch.object(
             self.btv._adb,
             "shell",
-            side_effect=(DEVICE_PROPERTIES_OUTPUT1, ETHMAC_OUTPUT1, WIFIMAC_OUTPUT1),
+            return_value=device_properties_mac_output(DEVICE_PROPERTIES_OUTPUT1, ETHMAC_OUTPUT1, WIFIMAC_OUTPUT1),
         ):
             device_properties = self.btv.get_device_properties()
             self.assertDictEqual(DEVICE_PROPERTIES_DICT1, device_properties)
@@ -561,7 +575,7 @@ class TestBaseTVSyncPython(unittest.TestCase):
         with patch.object(
             self.btv._adb,
             "shell",
-            side_effect=(DEVICE_PROPERTIES_OUTPUT2, ETHMAC_OUTPUT1, WIFIMAC_OUTPUT1),
+            return_value=device_properties_mac_output(DEVICE_PROPERTIES_OUTPUT2, ETHMAC_OUTPUT1, WIFIMAC_OUTPUT1),
         ):
             device_properties = self.btv.get_device_properties()
             self.assertDictEqual(DEVICE_PROPERTIES_DICT2, device_properties)
@@ -569,23 +583,25 @@ class TestBaseTVSyncPython(unittest.TestCase):
         with patch.object(
             self.btv._adb,
             "shell",
-            side_effect=(DEVICE_PROPERTIES_OUTPUT3, ETHMAC_OUTPUT3, WIFIMAC_OUTPUT3),
+            return_value=device_properties_mac_output(DEVICE_PROPERTIES_OUTPUT3, ETHMAC_OUTPUT3, WIFIMAC_OUTPUT3),
         ):
             device_properties = self.btv.get_device_properties()
             self.assertDictEqual(DEVICE_PROPERTIES_DICT3, device_properties)
 
-        with patch.object(self.btv._adb, "shell", side_effect=("manufacturer", None, "No match")):
+        with patch.object(
+            self.btv._adb, "shell", return_value=device_properties_mac_output("manufacturer", None, "No match")
+        ):
             device_properties = self.btv.get_device_properties()
             self.assertDictEqual({"ethmac": None, "wifimac": None}, device_properties)
 
-        with patch.object(self.btv._adb, "shell", side_effect=("", None, "No match")):
+        with patch.object(self.btv._adb, "shell", return_value=device_properties_mac_output("", None, "No match")):
             device_properties = self.btv.get_device_properties()
             self.assertDictEqual({"ethmac": None, "wifimac": None}, device_properties)
 
         with patch.object(
             self.btv._adb,
             "shell",
-            side_effect=(DEVICE_PROPERTIES_GOOGLE_TV, ETHMAC_GOOGLE, WIFIMAC_GOOGLE),
+            return_value=device_properties_mac_output(DEVICE_PROPERTIES_GOOGLE_TV, ETHMAC_GOOGLE, WIFIMAC_GOOGLE),
         ):
             self.btv = AndroidTVSync.from_base(self.btv)
             device_properties = self.btv.get_device_properties()
@@ -605,7 +621,7 @@ class TestBaseTVSyncPython(unittest.TestCase):
         with patch.object(
             self.btv._adb,
             "shell",
-            side_effect=(DEVICE_PROPERTIES_OUTPUT_SONY_TV, ETHMAC_SONY, WIFIMAC_SONY),
+            return_value=device_properties_mac_output(DEVICE_PROPERTIES_OUTPUT_SONY_TV, ETHMAC_SONY, WIFIMAC_SONY),
         ):
             device_properties = self.btv.get_device_properties()
             self.assertDictEqual(DEVICE_PROPERTIES_DICT_SONY_TV, device_properties)
@@ -613,10 +629,8 @@ class TestBaseTVSyncPython(unittest.TestCase):
         with patch.object(
             self.btv._adb,
             "shell",
-            side_effect=(
-                DEVICE_PROPERTIES_OUTPUT_SHIELD_TV_11,
-                ETHMAC_SHIELD_TV_11,
-                WIFIMAC_SHIELD_TV_11,
+            return_value=device_properties_mac_output(
+                DEVICE_PROPERTIES_OUTPUT_SHIELD_TV_11, ETHMAC_SHIELD_TV_11, WIFIMAC_SHIELD_TV_11
             ),
         ):
             self.btv = AndroidTVSync.from_base(self.btv)
@@ -626,6 +640,8 @@ class TestBaseTVSyncPython(unittest.TestCase):
             self.assertDictEqual(DEVICE_PROPERTIES_DICT_SHIELD_TV_11, device_properties)
             # _cmd_audio_state
             self.assertEqual(self.btv._cmd_audio_state(), constants.CMD_AUDIO_STATE11)
+            # _cmd_audio_state_stream_music
+            self.assertEqual(self.btv._cmd_audio_state_stream_music(), constants.CMD_AUDIO_STATE11_STREAM_MUSIC)
             # _cmd_volume_set
             self.assertEqual(self.btv._cmd_volume_set(), constants.CMD_VOLUME_SET_COMMAND11)
             # _cmd_current_app
@@ -646,10 +662,8 @@ class TestBaseTVSyncPython(unittest.TestCase):
         with patch.object(
             self.btv._adb,
             "shell",
-            side_effect=(
-                DEVICE_PROPERTIES_OUTPUT_SHIELD_TV_12,
-                ETHMAC_SHIELD_TV_12,
-                WIFIMAC_SHIELD_TV_12,
+            return_value=device_properties_mac_output(
+                DEVICE_PROPERTIES_OUTPUT_SHIELD_TV_12, ETHMAC_SHIELD_TV_12, WIFIMAC_SHIELD_TV_12
             ),
         ):
             self.btv = AndroidTVSync.from_base(self.btv)
@@ -659,6 +673,8 @@ class TestBaseTVSyncPython(unittest.TestCase):
             self.assertDictEqual(DEVICE_PROPERTIES_DICT_SHIELD_TV_12, device_properties)
             # _cmd_audio_state
             self.assertEqual(self.btv._cmd_audio_state(), constants.CMD_AUDIO_STATE11)
+            # _cmd_audio_state_stream_music
+            self.assertEqual(self.btv._cmd_audio_state_stream_music(), constants.CMD_AUDIO_STATE11_STREAM_MUSIC)
             # _cmd_volume_set
             self.assertEqual(self.btv._cmd_volume_set(), constants.CMD_VOLUME_SET_COMMAND11)
             # _cmd_current_app
@@ -679,10 +695,8 @@ class TestBaseTVSyncPython(unittest.TestCase):
         with patch.object(
             self.btv._adb,
             "shell",
-            side_effect=(
-                DEVICE_PROPERTIES_OUTPUT_SHIELD_TV_13,
-                ETHMAC_SHIELD_TV_13,
-                WIFIMAC_SHIELD_TV_13,
+            return_value=device_properties_mac_output(
+                DEVICE_PROPERTIES_OUTPUT_SHIELD_TV_13, ETHMAC_SHIELD_TV_13, WIFIMAC_SHIELD_TV_13
             ),
         ):
             self.btv = AndroidTVSync.from_base(self.btv)
@@ -692,6 +706,8 @@ class TestBaseTVSyncPython(unittest.TestCase):
             self.assertDictEqual(DEVICE_PROPERTIES_DICT_SHIELD_TV_13, device_properties)
             # _cmd_audio_state
             self.assertEqual(self.btv._cmd_audio_state(), constants.CMD_AUDIO_STATE11)
+            # _cmd_audio_state_stream_music
+            self.assertEqual(self.btv._cmd_audio_state_stream_music(), constants.CMD_AUDIO_STATE11_STREAM_MUSIC)
             # _cmd_volume_set
             self.assertEqual(self.btv._cmd_volume_set(), constants.CMD_VOLUME_SET_COMMAND11)
             # _cmd_current_app
@@ -709,6 +725,52 @@ class TestBaseTVSyncPython(unittest.TestCase):
                 constants.CMD_LAUNCH_APP13.format("TEST"),
             )
 
+    def test_get_device_properties_cached(self):
+        """Check that ``get_device_properties`` uses the cached properties when ``refresh`` is ``False``."""
+        with patch.dict(BaseTVSync._device_properties_cache, clear=True):
+            # Nothing is cached, so the device is queried
+            with patch.object(
+                self.btv._adb,
+                "shell",
+                return_value=device_properties_mac_output(DEVICE_PROPERTIES_OUTPUT1, ETHMAC_OUTPUT1, WIFIMAC_OUTPUT1),
+            ) as patched:
+                device_properties = self.btv.get_device_properties(refresh=False)
+                self.assertDictEqual(DEVICE_PROPERTIES_DICT1, device_properties)
+                assert patched.called
+
+            # The cached properties are used, even for a new object with the same host and port
+            btv = BaseTVSync("HOST", 5555)
+            with patch.object(btv._adb, "shell") as patched:
+                device_properties = btv.get_device_properties(refresh=False)
+                self.assertDictEqual(DEVICE_PROPERTIES_DICT1, device_properties)
+                assert not patched.called
+
+            # A failed query does not overwrite the cached properties
+            with patch.object(self.btv._adb, "shell", return_value=None):
+                self.btv.get_device_properties()
+                self.assertDictEqual(DEVICE_PROPERTIES_DICT1, self.btv.get_device_properties(refresh=False))
+
+            # Refreshing queries the device and updates the cached properties
+            with patch.object(
+                self.btv._adb,
+                "shell",
+                return_value=device_properties_mac_output(DEVICE_PROPERTIES_OUTPUT2, ETHMAC_OUTPUT1, WIFIMAC_OUTPUT1),
+            ):
+                device_properties = self.btv.get_device_properties(refresh=True)
+                self.assertDictEqual(DEVICE_PROPERTIES_DICT2, device_properties)
+
+            self.assertDictEqual(DEVICE_PROPERTIES_DICT2, btv.get_device_properties(refresh=False))
+
+            # The cache is cleared once it is full
+            btv = BaseTVSync("HOST2", 5555)
+            with patch.object(BaseTV, "_DEVICE_PROPERTIES_CACHE_MAXSIZE", 1), patch.object(
+                btv._adb,
+                "shell",
+                return_value=device_properties_mac_output(DEVICE_PROPERTIES_OUTPUT1, ETHMAC_OUTPUT1, WIFIMAC_OUTPUT1),
+            ):
+                btv.get_device_properties()
+                self.assertNotIn(("HOST", 5555), BaseTVSync._device_properties_cache)
+
     def test_get_installed_apps(self):
         """ "Check that `get_installed_apps` works correctly."""
         with patchers.patch_shell(INSTALLED_APPS_OUTPUT_1)[self.PATCH_KEY]:
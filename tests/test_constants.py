@@ -65,7 +65,7 @@ class TestConstants(unittest.TestCase):
         # CMD_AUDIO_STATE
         self.assertCommand(
             constants.CMD_AUDIO_STATE,
-            r"dumpsys audio | grep paused | grep -qv 'Buffer Queue' && echo -e '1\c' || (dumpsys audio | grep started | grep -qv 'Buffer Queue' && echo '2\c' || echo '0\c')",
+            r"CURRENT_AUDIO_STATE=$(dumpsys audio | grep -v 'Buffer Queue' | grep -E -o 'paused|started') ; echo $CURRENT_AUDIO_STATE | grep -q paused && echo -e '1\c' || { echo $CURRENT_AUDIO_STATE | grep -q started && echo '2\c' || echo '0\c' ; }",
         )
 
         # CMD_AUDIO_STATE11
@@ -74,6 +74,18 @@ class TestConstants(unittest.TestCase):
             r"CURRENT_AUDIO_STATE=$(dumpsys audio | sed -r -n '/[0-9]{2}-[0-9]{2}.*player piid:.*state:.*$/h; ${x;p;}') && echo $CURRENT_AUDIO_STATE | grep -q paused && echo -e '1\c' || { echo $CURRENT_AUDIO_STATE | grep -q started && echo '2\c' || echo '0\c' ; }",
         )
 
+        # CMD_AUDIO_STATE11_STREAM_MUSIC
+        self.assertCommand(
+            constants.CMD_AUDIO_STATE11_STREAM_MUSIC,
+            r"CURRENT_AUDIO_STATE=$(dumpsys audio | sed -r -n '/[0-9]{2}-[0-9]{2}.*player piid:.*state:.*$/h; ${x;p;}') && echo $CURRENT_AUDIO_STATE | grep -q paused && echo -e '1\c' || { echo $CURRENT_AUDIO_STATE | grep -q started && echo '2\c' || echo '0\c' ; } ; echo && dumpsys audio | grep '\- STREAM_MUSIC:' -A 11",
+        )
+
+        # CMD_AUDIO_STATE_STREAM_MUSIC
+        self.assertCommand(
+            constants.CMD_AUDIO_STATE_STREAM_MUSIC,
+            r"CURRENT_AUDIO_STATE=$(dumpsys audio | grep -v 'Buffer Queue' | grep -E -o 'paused|started') ; echo $CURRENT_AUDIO_STATE | grep -q paused && echo -e '1\c' || { echo $CURRENT_AUDIO_STATE | grep -q started && echo '2\c' || echo '0\c' ; } ; echo && dumpsys audio | grep '\- STREAM_MUSIC:' -A 11",
+        )
+
         # CMD_AWAKE
         self.assertCommand(constants.CMD_AWAKE, r"dumpsys power | grep mWakefulness | grep -q Awake")
 
@@ -143,6 +155,12 @@ class TestConstants(unittest.TestCase):
             r"getprop ro.product.manufacturer && getprop ro.product.model && getprop ro.serialno && getprop ro.build.version.release",
         )
 
+        # CMD_DEVICE_PROPERTIES_MAC
+        self.assertCommand(
+            constants.CMD_DEVICE_PROPERTIES_MAC,
+            r"getprop ro.product.manufacturer && getprop ro.product.model && getprop ro.serialno && getprop ro.build.version.release ; echo ETHMAC ; ip addr show eth0 | grep -m 1 ether ; echo WIFIMAC ; ip addr show wlan0 | grep -m 1 ether",
+        )
+
         # CMD_HDMI_INPUT
         self.assertCommand(
             constants.CMD_HDMI_INPUT,
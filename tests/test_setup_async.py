@@ -7,6 +7,7 @@ sys.path.insert(0, "..")
 
 from androidtv.setup_async import setup
 from androidtv.androidtv.androidtv_async import AndroidTVAsync
+from androidtv.basetv.basetv import BaseTV
 from androidtv.firetv.firetv_async import FireTVAsync
 
 from . import async_patchers
@@ -39,6 +40,13 @@ DEVICE_PROPERTIES_DICT2 = {
 class TestSetup(unittest.TestCase):
     PATCH_KEY = "python"
 
+    def setUp(self):
+        self.patch_device_properties_cache = patch.dict(BaseTV._device_properties_cache, clear=True)
+        self.patch_device_properties_cache.start()
+
+    def tearDown(self):
+        self.patch_device_properties_cache.stop()
+
     @awaiter
     async def test_setup(self):
         """Test that the ``setup`` function works correctly."""
@@ -55,24 +63,45 @@ class TestSetup(unittest.TestCase):
         with async_patchers.PATCH_ADB_DEVICE_TCP, async_patchers.patch_connect(True)[
             self.PATCH_KEY
         ], async_patchers.patch_shell(DEVICE_PROPERTIES_OUTPUT2)[self.PATCH_KEY]:
-            atv = await setup("HOST", 5555)
+            atv = await setup("HOST", 5555, refresh_device_properties=True)
             self.assertIsInstance(atv, AndroidTVAsync)
             self.assertDictEqual(atv.device_properties, DEVICE_PROPERTIES_DICT2)
 
         with async_patchers.PATCH_ADB_DEVICE_TCP, async_patchers.patch_connect(True)[
             self.PATCH_KEY
         ], async_patchers.patch_shell(DEVICE_PROPERTIES_OUTPUT1)[self.PATCH_KEY]:
-            ftv = await setup("HOST", 5555, device_class="androidtv")
+            ftv = await setup("HOST", 5555, device_class="androidtv", refresh_device_properties=True)
             self.assertIsInstance(ftv, AndroidTVAsync)
             self.assertDictEqual(ftv.device_properties, DEVICE_PROPERTIES_DICT1)
 
         with async_patchers.PATCH_ADB_DEVICE_TCP, async_patchers.patch_connect(True)[
             self.PATCH_KEY
         ], async_patchers.patch_shell(DEVICE_PROPERTIES_OUTPUT2)[self.PATCH_KEY]:
-            atv = await setup("HOST", 5555, device_class="firetv")
+            atv = await setup("HOST", 5555, device_class="firetv", refresh_device_properties=True)
             self.assertIsInstance(atv, FireTVAsync)
             self.assertDictEqual(atv.device_properties, DEVICE_PROPERTIES_DICT2)
 
+    @awaiter
+    async def test_setup_cached_device_properties(self):
+        """Test that the ``setup`` function uses the cached device properties unless they are refreshed."""
+        with async_patchers.PATCH_ADB_DEVICE_TCP, async_patchers.patch_connect(True)[
+            self.PATCH_KEY
+        ], async_patchers.patch_shell(DEVICE_PROPERTIES_OUTPUT1)[self.PATCH_KEY]:
+            ftv = await setup("HOST", 5555)
+            self.assertIsInstance(ftv, FireTVAsync)
+            self.assertDictEqual(ftv.device_properties, DEVICE_PROPERTIES_DICT1)
+
+        with async_patchers.PATCH_ADB_DEVICE_TCP, async_patchers.patch_connect(True)[
+            self.PATCH_KEY
+        ], async_patchers.patch_shell(DEVICE_PROPERTIES_OUTPUT2)[self.PATCH_KEY]:
+            ftv = await setup("HOST", 5555)
+            self.assertIsInstance(ftv, FireTVAsync)
+            self.assertDictEqual(ftv.device_properties, DEVICE_PROPERTIES_DICT1)
+
+            atv = await setup("HOST", 5555, refresh_device_properties=True)
+            self.assertIsInstance(atv, AndroidTVAsync)
+            self.assertDictEqual(atv.device_properties, DEVICE_PROPERTIES_DICT2)
+
 
 if __name__ == "__main__":
     unittest.main()
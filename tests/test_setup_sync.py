@@ -13,6 +13,7 @@ sys.path.insert(0, "..")
 
 from androidtv import setup
 from androidtv.androidtv.androidtv_sync import AndroidTVSync
+from androidtv.basetv.basetv import BaseTV
 from androidtv.firetv.firetv_sync import FireTVSync
 from . import patchers
 
@@ -43,6 +44,13 @@ DEVICE_PROPERTIES_DICT2 = {
 class TestSetup(unittest.TestCase):
     PATCH_KEY = "python"
 
+    def setUp(self):
+        self.patch_device_properties_cache = patch.dict(BaseTV._device_properties_cache, clear=True)
+        self.patch_device_properties_cache.start()
+
+    def tearDown(self):
+        self.patch_device_properties_cache.stop()
+
     def test_setup(self):
         """Test that the ``setup`` function works correctly."""
         with self.assertRaises(ValueError):
@@ -58,24 +66,44 @@ class TestSetup(unittest.TestCase):
         with patchers.PATCH_ADB_DEVICE_TCP, patchers.patch_connect(True)[self.PATCH_KEY], patchers.patch_shell(
             DEVICE_PROPERTIES_OUTPUT2
         )[self.PATCH_KEY]:
-            atv = setup("HOST", 5555)
+            atv = setup("HOST", 5555, refresh_device_properties=True)
             self.assertIsInstance(atv, AndroidTVSync)
             self.assertDictEqual(atv.device_properties, DEVICE_PROPERTIES_DICT2)
 
         with patchers.PATCH_ADB_DEVICE_TCP, patchers.patch_connect(True)[self.PATCH_KEY], patchers.patch_shell(
             DEVICE_PROPERTIES_OUTPUT1
         )[self.PATCH_KEY]:
-            ftv = setup("HOST", 5555, device_class="androidtv")
+            ftv = setup("HOST", 5555, device_class="androidtv", refresh_device_properties=True)
             self.assertIsInstance(ftv, AndroidTVSync)
             self.assertDictEqual(ftv.device_properties, DEVICE_PROPERTIES_DICT1)
 
         with patchers.PATCH_ADB_DEVICE_TCP, patchers.patch_connect(True)[self.PATCH_KEY], patchers.patch_shell(
             DEVICE_PROPERTIES_OUTPUT2
         )[self.PATCH_KEY]:
-            atv = setup("HOST", 5555, device_class="firetv")
+            atv = setup("HOST", 5555, device_class="firetv", refresh_device_properties=True)
             self.assertIsInstance(atv, FireTVSync)
             self.assertDictEqual(atv.device_properties, DEVICE_PROPERTIES_DICT2)
 
+    def test_setup_cached_device_properties(self):
+        """Test that the ``setup`` function uses the cached device properties unless they are refreshed."""
+        with patchers.PATCH_ADB_DEVICE_TCP, patchers.patch_connect(True)[self.PATCH_KEY], patchers.patch_shell(
+            DEVICE_PROPERTIES_OUTPUT1
+        )[self.PATCH_KEY]:
+            ftv = setup("HOST", 5555)
+            self.assertIsInstance(ftv, FireTVSync)
+            self.assertDictEqual(ftv.device_properties, DEVICE_PROPERTIES_DICT1)
+
+        with patchers.PATCH_ADB_DEVICE_TCP, patchers.patch_connect(True)[self.PATCH_KEY], patchers.patch_shell(
+            DEVICE_PROPERTIES_OUTPUT2
+        )[self.PATCH_KEY]:
+            ftv = setup("HOST", 5555)
+            self.assertIsInstance(ftv, FireTVSync)
+            self.assertDictEqual(ftv.device_properties, DEVICE_PROPERTIES_DICT1)
+
+            atv = setup("HOST", 5555, refresh_device_properties=True)
+            self.assertIsInstance(atv, AndroidTVSync)
+            self.assertDictEqual(atv.device_properties, DEVICE_PROPERTIES_DICT2)
+
 
 if __name__ == "__main__":
     unittest.main()